@@ -0,0 +1,32 @@
+"""
+Django settings for running the test suite.
+
+Uses an in-memory SQLite database so tests don't need Postgres.
+"""
+from app.settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        # An in-memory DB can't be kept between runs with --keepdb, so
+        # build the schema straight from the models instead of migrating.
+        'TEST': {
+            'MIGRATE': False,
+        },
+    }
+}
+
+# The default PBKDF2 hasher is deliberately slow; tests don't need that.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Tests don't exercise security headers, CSRF or clickjacking protection.
+# Sessions, auth and messages stay because the admin requires them.
+MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+]
@@ -1,26 +1,74 @@
 """
 Django command to wait for the DB to be available
 """
+import random
+import socket
 import time
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 from django.db.utils import OperationalError
 from psycopg2 import OperationalError as Psycopg2Error
 
+BACKOFF_BASE = 0.05
+BACKOFF_CAP = 2.0
+BACKOFF_JITTER = 0.1
+PROBE_TIMEOUT = 0.2
+
+
+def backoff_delay(attempt):
+    """Exponential backoff with jitter for the given attempt number"""
+    # Clamp the exponent: the cap is reached long before 2 ** 10, and an
+    # unbounded power overflows float conversion after ~1000 attempts.
+    delay = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** min(attempt, 10))
+    return delay + random.uniform(0, BACKOFF_JITTER)
+
+
+def probe_db_port(settings_dict):
+    """Cheap TCP check that the DB port accepts connections"""
+    host = settings_dict.get('HOST')
+    if not host or host.startswith('/'):
+        # libpq uses a Unix domain socket, nothing to probe over TCP
+        return
+    port = int(settings_dict.get('PORT') or 5432)
+    with socket.create_connection((host, port), timeout=PROBE_TIMEOUT):
+        pass
+
 
 class Command(BaseCommand):
     """Django command to wait for DB"""
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=60,
+            help='Seconds to wait for the DB before giving up',
+        )
+
     def handle(self, *args, **options):
         """Entrypoin for command"""
         self.stdout.write("Waiting for database")
+        deadline = time.monotonic() + options['timeout']
+        attempt = 0
         db_up = False
 
         while not db_up:
             try:
-                self.check(databases=['default'])
+                probe_db_port(connections['default'].settings_dict)
+                connections['default'].ensure_connection()
                 db_up = True
-            except (Psycopg2Error, OperationalError):
-                self.stdout.write("DB unavailable, waiting 1 sec")
-                time.sleep(1)
+            except (OSError, Psycopg2Error, OperationalError):
+                if time.monotonic() >= deadline:
+                    raise CommandError("DB unavailable, giving up")
+                delay = backoff_delay(attempt)
+                self.stdout.write(f"DB unavailable, waiting {delay:.2f} sec")
+                time.sleep(delay)
+                attempt += 1
+
+        # Connections are lazy; run a trivial query so auth and any TLS
+        # session are established before the first real request. Only
+        # reused when called in-process with CONN_MAX_AGE set.
+        with connections['default'].cursor() as cursor:
+            cursor.execute('SELECT 1')
         self.stdout.write(self.style.SUCCESS("DB Available"))
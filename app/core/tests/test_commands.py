@@ -6,26 +6,117 @@ from unittest.mock import patch
 from psycopg2 import OperationalError as Pg2Error
 
 from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.db.utils import OperationalError as OpError
 from django.test import SimpleTestCase
 
+from core.management.commands.wait_for_db import (
+    BACKOFF_BASE,
+    BACKOFF_CAP,
+    BACKOFF_JITTER,
+    backoff_delay,
+    probe_db_port,
+)
+
 
-@patch('core.management.commands.wait_for_db.Command.check')
 class CommandTest(SimpleTestCase):
     """Test commands"""
 
-    def test_wait_for_db_ready(self, patched_check):
-        patched_check.return_value = True
+    def setUp(self):
+        connections_patcher = patch(
+            'core.management.commands.wait_for_db.connections'
+        )
+        socket_patcher = patch(
+            'core.management.commands.wait_for_db.socket.create_connection'
+        )
+        self.patched_connections = connections_patcher.start()
+        self.patched_socket = socket_patcher.start()
+        self.addCleanup(connections_patcher.stop)
+        self.addCleanup(socket_patcher.stop)
+
+        self.db = self.patched_connections['default']
+        self.db.settings_dict = {'HOST': 'db', 'PORT': ''}
+
+    def test_wait_for_db_ready(self):
+        call_command('wait_for_db')
+
+        self.patched_socket.assert_called_once_with(('db', 5432), timeout=0.2)
+        self.db.ensure_connection.assert_called_once_with()
+
+    def test_wait_for_db_warms_connection(self):
+        cursor = self.db.cursor.return_value
+
+        call_command('wait_for_db')
+
+        cursor.__enter__.return_value.execute.assert_called_once_with(
+            'SELECT 1'
+        )
+
+    @patch('time.sleep')
+    def test_wait_for_db_delay(self, patched_sleep):
+        ensure_connection = self.db.ensure_connection
+        ensure_connection.side_effect = [Pg2Error] * 2 + [OpError] * 3 + [None]
+
+        call_command('wait_for_db')
+
+        self.assertEquals(ensure_connection.call_count, 6)
+        self.assertEqual(self.patched_socket.call_count, 6)
+
+    @patch('time.sleep')
+    def test_wait_for_db_backoff(self, patched_sleep):
+        self.db.ensure_connection.side_effect = [OpError] * 3 + [None]
 
         call_command('wait_for_db')
 
-        patched_check.assert_called_once_with(databases=['default'])
+        delays = [c.args[0] for c in patched_sleep.call_args_list]
+        self.assertEqual(len(delays), 3)
+        for attempt, delay in enumerate(delays):
+            expected = BACKOFF_BASE * 2 ** attempt
+            self.assertGreaterEqual(delay, expected)
+            self.assertLessEqual(delay, expected + BACKOFF_JITTER)
+
+    @patch('time.monotonic')
+    @patch('time.sleep')
+    def test_wait_for_db_timeout(self, patched_sleep, patched_monotonic):
+        self.db.ensure_connection.side_effect = OpError
+        patched_monotonic.side_effect = [0, 1, 2, 100]
+
+        with self.assertRaises(CommandError):
+            call_command('wait_for_db', timeout=10)
+
+        self.assertEqual(self.db.ensure_connection.call_count, 3)
+
+    def test_backoff_delay_capped(self):
+        delay = backoff_delay(100)
+
+        self.assertGreaterEqual(delay, BACKOFF_CAP)
+        self.assertLessEqual(delay, BACKOFF_CAP + BACKOFF_JITTER)
+
+    def test_backoff_delay_large_attempt(self):
+        delay = backoff_delay(2000)
+
+        self.assertGreaterEqual(delay, 2.0)
+        self.assertLessEqual(delay, 2.1)
 
     @patch('time.sleep')
-    def test_wait_for_db_delay(self, patched_sleep, patched_check):
-        patched_check.side_effect = [Pg2Error] * 2 + [OpError] * 3 + [True]
+    def test_wait_for_db_port_closed(self, patched_sleep):
+        self.patched_socket.side_effect = [ConnectionRefusedError] * 2 + [
+            self.patched_socket.return_value
+        ]
 
         call_command('wait_for_db')
 
-        self.assertEquals(patched_check.call_count, 6)
-        patched_check.assert_called_with(databases=['default'])
+        self.assertEqual(self.patched_socket.call_count, 3)
+        self.patched_socket.assert_called_with(('db', 5432), timeout=0.2)
+        self.db.ensure_connection.assert_called_once_with()
+
+    def test_probe_skips_unix_socket(self):
+        probe_db_port({'HOST': '/var/run/postgresql', 'PORT': ''})
+
+        self.patched_socket.assert_not_called()
+
+    def test_probe_skips_empty_host(self):
+        probe_db_port({'HOST': '', 'PORT': ''})
+        probe_db_port({'HOST': None, 'PORT': None})
+
+        self.patched_socket.assert_not_called()
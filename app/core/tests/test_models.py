@@ -8,9 +8,11 @@ from decimal import Decimal
 
 from core import models
 
+User = get_user_model()
+
 
 def create_user(email='user@example.com', password='userpass123'):
-    return get_user_model().objects.create_user(email, password)
+    return User.objects.create_user(email, password)
 
 
 class ModelTests(TestCase):
@@ -18,7 +20,7 @@ class ModelTests(TestCase):
     def test_create_user_with_email_successful(self):
         email = 'test@example.com'
         password = 'testpass123'
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email=email,
             password=password,
         )
@@ -35,22 +37,24 @@ class ModelTests(TestCase):
         ]
 
         for email, expected in sample_emails:
-            user = get_user_model().objects.create_user(
-                email=email,
-                password="Pass123",
-            )
+            with self.subTest(email=email):
+                user = User.objects.create_user(
+                    email=email,
+                    password="Pass123",
+                )
+                user.refresh_from_db()
 
-            self.assertEqual(user.email, expected)
+                self.assertEqual(user.email, expected)
 
     def test_new_user_without_email_raises_error(self):
         with self.assertRaises(ValueError):
-            get_user_model().objects.create_user(
+            User.objects.create_user(
                 email="",
                 password="Pass123",
             )
 
     def test_greate_superuser(self):
-        user = get_user_model().objects.create_superuser(
+        user = User.objects.create_superuser(
             email="superuser@example.com",
             password="Pass123"
         )
@@ -0,0 +1,32 @@
+"""
+Helpers for creating fixtures in recipe tests
+"""
+from decimal import Decimal
+from types import MappingProxyType
+
+from django.contrib.auth import get_user_model
+
+from core.models import Recipe
+
+User = get_user_model()
+
+_RECIPE_DEFAULTS = MappingProxyType({
+    'title': 'Sample recipe title',
+    'time_minutes': 5,
+    'price': Decimal('5.25'),
+    'description': 'Sample recipe description',
+    'link': 'http://example.com/recipe.pdf'
+})
+
+
+def create_user(email='user@example.com', password='userpass123', **params):
+    """Create and return a new user."""
+    return User.objects.create_user(email, password, **params)
+
+
+def create_recipe(user, **params):
+    """Create and return a recipe, overriding defaults with params."""
+    defaults = {**_RECIPE_DEFAULTS, **params}
+
+    recipe = Recipe.objects.create(user=user, **defaults)
+    return recipe
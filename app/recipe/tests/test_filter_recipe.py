@@ -1,48 +1,25 @@
-from decimal import Decimal
-
-from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from core.models import Recipe, Tag, Ingredient
-from recipe.serializers import (
-    RecipeSerializer
-)
+from core.models import Tag, Ingredient
+from recipe.tests.factories import create_user, create_recipe
 
 RECIPE_URL = reverse('recipe:recipe-list')
 
 
-def create_user(**params):
-    """Create and return a new user."""
-    return get_user_model().objects.create_user(**params)
-
-
-def create_recipe(user, **params):
-    defaults = {
-        'title': 'Sample recipe title',
-        'time_minutes': 5,
-        'price': Decimal('5.25'),
-        'description': 'Sample recipe description',
-        'link': 'http://example.com/recipe.pdf'
-    }
-
-    defaults.update(params)
-
-    recipe = Recipe.objects.create(user=user, **defaults)
-    return recipe
-
-
 class FilteringRecipesTests(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='user@example.com',
             password='pass123',
         )
 
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_filter_by_tags(self):
@@ -55,20 +32,17 @@ class FilteringRecipesTests(TestCase):
         recipe1.tags.add(tag1)
         recipe2.tags.add(tag2)
 
-        recipe3 = create_recipe(user=self.user, title='Mexican')
+        create_recipe(user=self.user, title='Mexican')
 
         params = {'tags': f'{tag1.id},{tag2.id}'}
 
         res = self.client.get(RECIPE_URL, params)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        recipe1_serialized = RecipeSerializer(recipe1).data
-        recipe2_serialized = RecipeSerializer(recipe2).data
-        recipe3_serialized = RecipeSerializer(recipe3).data
-
-        self.assertIn(recipe1_serialized, res.data)
-        self.assertIn(recipe2_serialized, res.data)
-        self.assertNotIn(recipe3_serialized, res.data)
+        self.assertEqual(
+            {recipe['id'] for recipe in res.data},
+            {recipe1.id, recipe2.id},
+        )
         self.assertEqual(len(res.data), 2)
 
     def test_filter_by_ingredients(self):
@@ -81,18 +55,15 @@ class FilteringRecipesTests(TestCase):
         recipe1.ingredients.add(ingredient1)
         recipe2.ingredients.add(ingredient2)
 
-        recipe3 = create_recipe(user=self.user, title='Thai')
+        create_recipe(user=self.user, title='Thai')
 
         params = {'ingredients': f'{ingredient1.id},{ingredient2.id}'}
 
         res = self.client.get(RECIPE_URL, params)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        recipe1_serialized = RecipeSerializer(recipe1).data
-        recipe2_serialized = RecipeSerializer(recipe2).data
-        recipe3_serialized = RecipeSerializer(recipe3).data
-
-        self.assertIn(recipe1_serialized, res.data)
-        self.assertIn(recipe2_serialized, res.data)
-        self.assertNotIn(recipe3_serialized, res.data)
+        self.assertEqual(
+            {recipe['id'] for recipe in res.data},
+            {recipe1.id, recipe2.id},
+        )
         self.assertEqual(len(res.data), 2)
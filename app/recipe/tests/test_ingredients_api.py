@@ -1,41 +1,31 @@
-from decimal import Decimal
+from functools import lru_cache
 
-from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)
 
-from core.models import Ingredient, Recipe
+from core.models import Ingredient
 from recipe.serializers import IngredientSerializer
+from recipe.tests.factories import create_user, create_recipe
+from recipe.views import IngredientViewSet
 
 INGREDIENT_URL = reverse('recipe:ingredient-list')
 
-
-def create_user(email='user@example.com', password='userpass123'):
-    return get_user_model().objects.create_user(email, password)
-
-
-def create_recipe(user, **params):
-    defaults = {
-        'title': 'Sample recipe title',
-        'time_minutes': 5,
-        'price': Decimal('5.25'),
-        'description': 'Sample recipe description',
-        'link': 'http://example.com/recipe.pdf'
-    }
-
-    defaults.update(params)
-
-    recipe = Recipe.objects.create(user=user, **defaults)
-    return recipe
+FACTORY = APIRequestFactory()
+INGREDIENT_LIST_VIEW = IngredientViewSet.as_view({'get': 'list'})
 
 
+@lru_cache(maxsize=None)
 def ingredient_detail_url(ingredient_id):
     return reverse('recipe:ingredient-detail', args=[ingredient_id])
 
 
-class PublicIngredientsTest(TestCase):
+class PublicIngredientsTest(SimpleTestCase):
 
     def setUp(self):
         self.client = APIClient()
@@ -46,25 +36,32 @@ class PublicIngredientsTest(TestCase):
 
 
 class PrivateIngredientsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
     def setUp(self):
         self.client = APIClient()
-        self.user = create_user()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_Ingredient(self):
-        Ingredient.objects.create(user=self.user, name='beetroot')
-        Ingredient.objects.create(user=self.user, name='carrot')
+        Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='beetroot'),
+            Ingredient(user=self.user, name='carrot'),
+        ])
 
-        res = self.client.get(INGREDIENT_URL)
+        request = FACTORY.get(INGREDIENT_URL)
+        force_authenticate(request, user=self.user)
+        res = INGREDIENT_LIST_VIEW(request)
 
-        ingredients = Ingredient.objects.all().order_by('-name')
+        ingredients = Ingredient.objects.only('id', 'name').order_by('-name')
 
         ser = IngredientSerializer(ingredients, many=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, ser.data)
 
-    def ingredients_limited_to_user(self):
+    def test_ingredients_limited_to_user(self):
         user2 = create_user(email='user2@example.com')
         Ingredient.objects.create(user=user2, name='beetroot')
 
@@ -123,12 +120,10 @@ class PrivateIngredientsTest(TestCase):
 
         res = self.client.get(INGREDIENT_URL, {'assigned_only': 1})
 
-        ingredient1_serialized = IngredientSerializer(ingredient1).data
-        ingredient2_serialized = IngredientSerializer(ingredient2).data
-
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertIn(ingredient1_serialized, res.data)
-        self.assertNotIn(ingredient2_serialized, res.data)
+        returned_ids = {ingredient['id'] for ingredient in res.data}
+        self.assertIn(ingredient1.id, returned_ids)
+        self.assertNotIn(ingredient2.id, returned_ids)
 
     def test_filter_assigned_ingredients_unique(self):
         recipe1 = create_recipe(user=self.user, title='Thai rice')
@@ -139,8 +134,7 @@ class PrivateIngredientsTest(TestCase):
         Ingredient.objects.create(user=self.user, name='butter')
 
         recipe1.ingredients.add(ingredient1)
-        recipe2.ingredients.add(ingredient1)
-        recipe2.ingredients.add(ingredient2)
+        recipe2.ingredients.add(ingredient1, ingredient2)
 
         res = self.client.get(INGREDIENT_URL, {'assigned_only': 1})
 
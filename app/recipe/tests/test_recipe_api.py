@@ -1,52 +1,44 @@
 import os
 import tempfile
 from decimal import Decimal
+from functools import lru_cache
 
 from PIL import Image
-from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)
 
 from core.models import Recipe, Tag, Ingredient
 from recipe.serializers import (
     RecipeSerializer,
     RecipeDetailSerializer
 )
+from recipe.tests.factories import create_user, create_recipe
+from recipe.views import RecipeViewSet
 
 RECIPE_URL = reverse('recipe:recipe-list')
 
-
-def create_user(**params):
-    """Create and return a new user."""
-    return get_user_model().objects.create_user(**params)
+FACTORY = APIRequestFactory()
+RECIPE_LIST_VIEW = RecipeViewSet.as_view({'get': 'list'})
+RECIPE_DETAIL_VIEW = RecipeViewSet.as_view({'get': 'retrieve'})
 
 
+@lru_cache(maxsize=None)
 def image_upload_url(recipe_id):
     return reverse('recipe:recipe-upload-image', args=[recipe_id])
 
 
+@lru_cache(maxsize=None)
 def detail_url(recipe_id):
     return reverse('recipe:recipe-detail', args=[recipe_id])
 
 
-def create_recipe(user, **params):
-    defaults = {
-        'title': 'Sample recipe title',
-        'time_minutes': 5,
-        'price': Decimal('5.25'),
-        'description': 'Sample recipe description',
-        'link': 'http://example.com/recipe.pdf'
-    }
-
-    defaults.update(params)
-
-    recipe = Recipe.objects.create(user=user, **defaults)
-    return recipe
-
-
-class TestPublicRecipeApi(TestCase):
+class TestPublicRecipeApi(SimpleTestCase):
 
     def setUp(self):
         self.client = APIClient()
@@ -58,22 +50,28 @@ class TestPublicRecipeApi(TestCase):
 
 class TestPrivateRecipeApi(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             'user@example.com',
             'pass123'
         )
 
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipes_list(self):
         create_recipe(user=self.user)
         create_recipe(user=self.user)
 
-        res = self.client.get(RECIPE_URL)
+        request = FACTORY.get(RECIPE_URL)
+        force_authenticate(request, user=self.user)
+        res = RECIPE_LIST_VIEW(request)
 
-        recipes = Recipe.objects.all().order_by('-id')
+        recipes = Recipe.objects.all().order_by('-id').prefetch_related(
+            'tags', 'ingredients'
+        )
 
         serializer = RecipeSerializer(recipes, many=True)
 
@@ -81,7 +79,7 @@ class TestPrivateRecipeApi(TestCase):
         self.assertEqual(res.data, serializer.data)
 
     def test_retrieve_user_recipes_only(self):
-        other_user = get_user_model().objects.create_user(
+        other_user = create_user(
             'user2@example.com',
             'pass123'
         )
@@ -90,7 +88,9 @@ class TestPrivateRecipeApi(TestCase):
 
         res = self.client.get(RECIPE_URL)
 
-        recipes = Recipe.objects.filter(user=self.user)
+        recipes = Recipe.objects.filter(user=self.user).prefetch_related(
+            'tags', 'ingredients'
+        )
 
         serializer = RecipeSerializer(recipes, many=True)
 
@@ -99,8 +99,9 @@ class TestPrivateRecipeApi(TestCase):
 
     def test_get_recipe_detail(self):
         recipe = create_recipe(user=self.user)
-        url = detail_url(recipe.id)
-        res = self.client.get(url)
+        request = FACTORY.get(detail_url(recipe.id))
+        force_authenticate(request, user=self.user)
+        res = RECIPE_DETAIL_VIEW(request, pk=recipe.id)
 
         serializer = RecipeDetailSerializer(recipe)
 
@@ -219,9 +220,10 @@ class TestPrivateRecipeApi(TestCase):
 
         recipe = Recipe.objects.get(id=res.data['id'])
 
-        self.assertEqual(recipe.tags.count(), 2)
-        for tag in recipe.tags.all():
-            self.assertIn({'name': tag.name}, payload['tags'])
+        self.assertCountEqual(
+            [{'name': tag.name} for tag in recipe.tags.all()],
+            payload['tags'],
+        )
 
     def test_create_recipe_with_mixed_tags(self):
         tag = Tag.objects.create(user=self.user, name='mexican')
@@ -241,13 +243,13 @@ class TestPrivateRecipeApi(TestCase):
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
         recipe = Recipe.objects.get(id=res.data['id'])
-        self.assertIn(tag, recipe.tags.all())
-
-        self.assertEqual(recipe.tags.count(), 2)
+        recipe_tags = list(recipe.tags.all())
+        self.assertIn(tag, recipe_tags)
+        self.assertEqual(len(recipe_tags), 2)
 
-        tags = Tag.objects.filter(user=self.user)
-        self.assertEqual(tags.count(), 2)
-        for tag in tags:
+        user_tags = list(Tag.objects.filter(user=self.user))
+        self.assertEqual(len(user_tags), 2)
+        for tag in user_tags:
             self.assertIn({'name': tag.name}, payload['tags'])
 
     def test_create_tag_on_patch_update_recipe(self):
@@ -267,9 +269,10 @@ class TestPrivateRecipeApi(TestCase):
 
         recipe = Recipe.objects.get(id=res.data['id'])
 
-        self.assertEqual(recipe.tags.count(), 2)
-        for tag in recipe.tags.all():
-            self.assertIn({'name': tag.name}, payload['tags'])
+        self.assertCountEqual(
+            [{'name': tag.name} for tag in recipe.tags.all()],
+            payload['tags'],
+        )
 
         update_payload = {'tags': [
             {'name': 'mexican'},
@@ -282,9 +285,10 @@ class TestPrivateRecipeApi(TestCase):
         update_res = self.client.patch(url, update_payload, format='json')
         self.assertEqual(update_res.status_code, status.HTTP_200_OK)
         # recipe.refresh_from_db()
-        self.assertEqual(recipe.tags.count(), 3)
-        for tag in recipe.tags.all():
-            self.assertIn({'name': tag.name}, update_payload['tags'])
+        self.assertCountEqual(
+            [{'name': tag.name} for tag in recipe.tags.all()],
+            update_payload['tags'],
+        )
 
     def test_assign_existing_tag_patch_update_recipe(self):
         recipe = create_recipe(user=self.user)
@@ -302,13 +306,10 @@ class TestPrivateRecipeApi(TestCase):
         update_res = self.client.patch(url, update_payload, format='json')
         self.assertEqual(update_res.status_code, status.HTTP_200_OK)
         # recipe.refresh_from_db()
-        self.assertEqual(recipe.tags.count(), 1)
-
-        tags = Tag.objects.filter(user=self.user).all()
+        user_tags = list(Tag.objects.filter(user=self.user))
+        self.assertEqual(len(user_tags), 2)
 
-        self.assertEqual(len(tags), 2)
-
-        actual_tags = recipe.tags.all()
+        actual_tags = list(recipe.tags.all())
         self.assertEqual(len(actual_tags), 1)
         self.assertEqual(actual_tags[0].name, tag2.name)
 
@@ -343,16 +344,17 @@ class TestPrivateRecipeApi(TestCase):
 
         recipe = Recipe.objects.get(id=res.data['id'])
 
-        self.assertEqual(recipe.ingredients.count(), 2)
-        for ingredient in recipe.ingredients.all():
-            self.assertIn({'name': ingredient.name}, payload['ingredients'])
-
-        ingredients = Ingredient.objects.filter(user=self.user).all()
+        self.assertCountEqual(
+            [{'name': i.name} for i in recipe.ingredients.all()],
+            payload['ingredients'],
+        )
 
-        self.assertEqual(len(ingredients), 2)
+        ingredients = Ingredient.objects.filter(user=self.user)
 
-        for ingredient in ingredients:
-            self.assertIn({'name': ingredient.name}, payload['ingredients'])
+        self.assertCountEqual(
+            [{'name': i.name} for i in ingredients],
+            payload['ingredients'],
+        )
 
     def test_create_recipe_with_mixed_ingredient(self):
         ingredient = Ingredient.objects.create(user=self.user, name='beetroot')
@@ -372,26 +374,30 @@ class TestPrivateRecipeApi(TestCase):
 
         recipe = Recipe.objects.get(id=res.data['id'])
 
-        self.assertEqual(recipe.ingredients.count(), 2)
-        for ingredient in recipe.ingredients.all():
-            self.assertIn({'name': ingredient.name}, payload['ingredients'])
-
-        ingredients = Ingredient.objects.filter(user=self.user).all()
+        self.assertCountEqual(
+            [{'name': i.name} for i in recipe.ingredients.all()],
+            payload['ingredients'],
+        )
 
-        self.assertEqual(len(ingredients), 2)
+        ingredients = Ingredient.objects.filter(user=self.user)
 
-        for ingredient in ingredients:
-            self.assertIn({'name': ingredient.name}, payload['ingredients'])
+        self.assertCountEqual(
+            [{'name': i.name} for i in ingredients],
+            payload['ingredients'],
+        )
 
 
 class ImageUpladTest(TestCase):
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='user@example.com',
             password='userpass123'
         )
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
         self.recipe = create_recipe(user=self.user)
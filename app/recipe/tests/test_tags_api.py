@@ -1,41 +1,31 @@
-from decimal import Decimal
+from functools import lru_cache
 
-from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)
 
-from core.models import Tag, Recipe
-from recipe.serializers import TagSerializer
+from core.models import Tag
+from recipe.tests.factories import create_user, create_recipe
+from recipe.views import TagViewSet
 
 TAGS_URL = reverse('recipe:tag-list')
 
-
-def create_user(email='user@example.com', password='userpass123'):
-    return get_user_model().objects.create_user(email, password)
-
-
-def create_recipe(user, **params):
-    defaults = {
-        'title': 'Sample recipe title',
-        'time_minutes': 5,
-        'price': Decimal('5.25'),
-        'description': 'Sample recipe description',
-        'link': 'http://example.com/recipe.pdf'
-    }
-
-    defaults.update(params)
-
-    recipe = Recipe.objects.create(user=user, **defaults)
-    return recipe
+FACTORY = APIRequestFactory()
+TAG_LIST_VIEW = TagViewSet.as_view({'get': 'list'})
+TAG_DETAIL_VIEW = TagViewSet.as_view({'delete': 'destroy'})
 
 
+@lru_cache(maxsize=None)
 def tag_detail_url(tag_id):
     return reverse('recipe:tag-detail', args=[tag_id])
 
 
-class PublicTagsTest(TestCase):
+class PublicTagsTest(SimpleTestCase):
 
     def setUp(self):
         self.client = APIClient()
@@ -46,31 +36,38 @@ class PublicTagsTest(TestCase):
 
 
 class PrivateTagsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.user2 = create_user(email='user2@example.com')
+
     def setUp(self):
         self.client = APIClient()
-        self.user = create_user()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
-        Tag.objects.create(user=self.user, name='halal')
-        Tag.objects.create(user=self.user, name='halal')
-
-        res = self.client.get(TAGS_URL)
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='halal'),
+            Tag(user=self.user, name='halal'),
+        ])
 
-        tags = Tag.objects.all().order_by('-name')
+        request = FACTORY.get(TAGS_URL)
+        force_authenticate(request, user=self.user)
+        res = TAG_LIST_VIEW(request)
 
-        ser = TagSerializer(tags, many=True)
+        expected = list(Tag.objects.order_by('-name').values('id', 'name'))
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, ser.data)
+        self.assertEqual([dict(tag) for tag in res.data], expected)
 
-    def tags_limited_to_user(self):
-        user2 = create_user(email='user2@example.com')
-        Tag.objects.create(user=user2, name='mediterranean')
+    def test_tags_limited_to_user(self):
+        Tag.objects.create(user=self.user2, name='mediterranean')
 
         tag = Tag.objects.create(user=self.user, name='halal')
 
-        res = self.client.get(TAGS_URL)
+        request = FACTORY.get(TAGS_URL)
+        force_authenticate(request, user=self.user)
+        res = TAG_LIST_VIEW(request)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(len(res.data), 1)
@@ -83,7 +80,7 @@ class PrivateTagsTest(TestCase):
         payload = {'name': 'desert'}
 
         url = tag_detail_url(tag.id)
-        res = self.client.patch(url, payload)
+        res = self.client.patch(url, payload, format='json')
 
         tag.refresh_from_db()
 
@@ -93,21 +90,21 @@ class PrivateTagsTest(TestCase):
     def test_delete_tag(self):
         tag = Tag.objects.create(user=self.user, name='halal')
 
-        url = tag_detail_url(tag.id)
-        res = self.client.delete(url)
+        request = FACTORY.delete(tag_detail_url(tag.id))
+        force_authenticate(request, user=self.user)
+        res = TAG_DETAIL_VIEW(request, pk=tag.id)
 
-        tag = Tag.objects.filter(id=tag.id)
-        self.assertFalse(tag.exists())
         self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Tag.objects.filter(id=tag.id).exists())
 
     def test_delete_other_user_tag(self):
-        user2 = create_user(email='user2@example.com')
-        user2_tag = Tag.objects.create(user=user2, name='mediterranean')
+        user2_tag = Tag.objects.create(user=self.user2, name='mediterranean')
 
         Tag.objects.create(user=self.user, name='halal')
 
-        url = tag_detail_url(user2_tag.id)
-        res = self.client.delete(url)
+        request = FACTORY.delete(tag_detail_url(user2_tag.id))
+        force_authenticate(request, user=self.user)
+        res = TAG_DETAIL_VIEW(request, pk=user2_tag.id)
 
         self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
 
@@ -119,14 +116,14 @@ class PrivateTagsTest(TestCase):
 
         recipe.tags.add(tag1)
 
-        res = self.client.get(TAGS_URL, {'assigned_only': 1})
-
-        tag1_serialized = TagSerializer(tag1).data
-        tag2_serialized = TagSerializer(tag2).data
+        request = FACTORY.get(TAGS_URL, {'assigned_only': 1})
+        force_authenticate(request, user=self.user)
+        res = TAG_LIST_VIEW(request)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertIn(tag1_serialized, res.data)
-        self.assertNotIn(tag2_serialized, res.data)
+        returned_ids = {tag['id'] for tag in res.data}
+        self.assertIn(tag1.id, returned_ids)
+        self.assertNotIn(tag2.id, returned_ids)
 
     def test_filter_assigned_tags_unique(self):
         recipe1 = create_recipe(user=self.user, title='Thai rice')
@@ -137,9 +134,10 @@ class PrivateTagsTest(TestCase):
         Tag.objects.create(user=self.user, name='butter')
 
         recipe1.tags.add(tag1)
-        recipe2.tags.add(tag1)
-        recipe2.tags.add(tag2)
+        recipe2.tags.add(tag1, tag2)
 
-        res = self.client.get(TAGS_URL, {'assigned_only': 1})
+        request = FACTORY.get(TAGS_URL, {'assigned_only': 1})
+        force_authenticate(request, user=self.user)
+        res = TAG_LIST_VIEW(request)
 
         self.assertEqual(len(res.data), 2)